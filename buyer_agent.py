@@ -1,15 +1,52 @@
 # buyer_agent.py
 from __future__ import annotations
 
+import asyncio
 import os
 import json
 import re
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import httpx  # optional: async HF requests share one connection pool
+except ImportError:
+    httpx = None
+
+try:
+    from numba import njit  # optional: JITs the numeric decision kernel
+except ImportError:
+    def njit(*args, **kwargs):  # no-op fallback when numba isn't installed
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        def deco(fn):
+            return fn
+        return deco
+
+
+_DOTENV_LOADED = False
+
+
+def _ensure_dotenv() -> None:
+    """Read .env once per process; building many agents in a batch run
+    shouldn't re-hit the filesystem for the same file."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+
+_ensure_dotenv()
+
 # ==============================
 # Hugging Face model wrapper
 # ==============================
@@ -19,7 +56,7 @@ class HuggingFaceModelWrapper:
     """
 
     def __init__(self, model_id: str = "meta-llama/Meta-Llama-3-8B-Instruct") -> None:
-        load_dotenv()  # read .env if present
+        _ensure_dotenv()  # .env already read at import; this is a no-op guard
         self.model_id = model_id
 
         # Primary expected var
@@ -35,32 +72,158 @@ class HuggingFaceModelWrapper:
             )
 
         self.endpoint = f"https://api-inference.huggingface.co/models/{self.model_id}"
-        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        # X-use-cache lets HF serve repeated prompts from its server-side cache.
+        self.headers = {"Authorization": f"Bearer {self.api_key}", "X-use-cache": "true"}
+
+        # Persistent session: keepalive + pooled sockets avoid a fresh TLS
+        # handshake on every round, and the Retry handles transient 5xx/429.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # allowed_methods=None retries all verbs; the default excludes
+            # POST, which is the only method this session ever issues.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=None,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self._async_client = None  # lazily created httpx.AsyncClient
+        self._async_client_loop = None  # event loop the client is bound to
 
-    def generate(self, prompt: str, max_tokens: int = 160, temperature: float = 0.7) -> str:
-        """Basic text generation call."""
-        payload = {
-            "inputs": prompt,
-            "parameters": {
-                "max_new_tokens": max_tokens,
-                "temperature": temperature,
-                # Keep defaults simple/robust for HF hosted inference
-                "return_full_text": False,
-            },
-        }
-        r = requests.post(self.endpoint, headers=self.headers, json=payload, timeout=60)
-        r.raise_for_status()
-        data = r.json()
+        # Warm the hosted model in the background: the first inference after
+        # idle can stall 10-30s while HF loads the weights, so pay that cost
+        # now instead of on the first real negotiate() call.
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        try:
+            self.generate("ping", max_tokens=1)
+        except Exception:
+            pass  # best effort; real calls still set wait_for_model
 
-        # HF responses can be list[{"generated_text": "..."}] or another shape.
+    @staticmethod
+    def _extract_text(data: Any) -> str:
+        """Pull generated_text out of the shapes HF is known to return."""
         if isinstance(data, list) and data and isinstance(data[0], dict) and "generated_text" in data[0]:
             return str(data[0]["generated_text"]).strip()
         if isinstance(data, dict) and "generated_text" in data:
             return str(data["generated_text"]).strip()
-
         # Fallback stringify
         return str(data)
 
+    def _build_payload(self, inputs: Any, max_tokens: int, temperature: Optional[float]) -> Dict[str, Any]:
+        parameters: Dict[str, Any] = {
+            "max_new_tokens": max_tokens,
+            # Keep defaults simple/robust for HF hosted inference
+            "return_full_text": False,
+        }
+        if temperature is None:
+            # Greedy decoding. HF backends reject temperature <= 0, so
+            # determinism is requested via do_sample instead.
+            parameters["do_sample"] = False
+        else:
+            parameters["temperature"] = temperature
+        return {
+            "inputs": inputs,
+            "parameters": parameters,
+            # Server-side caching for repeated prompts; wait_for_model avoids
+            # 503s while the hosted model spins up.
+            "options": {"use_cache": True, "wait_for_model": True},
+        }
+
+    def generate(self, prompt: str, max_tokens: int = 160, temperature: Optional[float] = 0.7) -> str:
+        """Basic text generation call."""
+        payload = self._build_payload(prompt, max_tokens, temperature)
+        r = self.session.post(self.endpoint, json=payload, timeout=60)
+        r.raise_for_status()
+        return self._extract_text(r.json())
+
+    def generate_stream(self, prompt: str, max_tokens: int = 160, temperature: Optional[float] = 0.7):
+        """Yield generated text incrementally (SSE token events).
+
+        TTFT is what matters for short rewrites: the caller can show output
+        as soon as the first token lands instead of waiting out the whole
+        generation. Falls back to one buffered chunk when the endpoint
+        doesn't stream.
+        """
+        payload = self._build_payload(prompt, max_tokens, temperature)
+        payload["stream"] = True
+        r = self.session.post(self.endpoint, json=payload, timeout=60, stream=True)
+        r.raise_for_status()
+        if "text/event-stream" not in r.headers.get("content-type", ""):
+            # Endpoint ignored stream=True; hand back the buffered body.
+            yield self._extract_text(r.json())
+            return
+        for line in r.iter_lines():
+            if not line:
+                continue
+            line = line.decode("utf-8", errors="replace")
+            if not line.startswith("data:"):
+                continue
+            chunk = line[5:].strip()
+            if chunk == "[DONE]":
+                break
+            try:
+                event = json.loads(chunk)
+            except ValueError:
+                continue
+            token = event.get("token") if isinstance(event, dict) else None
+            if token and token.get("text") and not token.get("special"):
+                yield token["text"]
+
+    async def generate_async(self, prompt: str, max_tokens: int = 160, temperature: Optional[float] = 0.7) -> str:
+        """Async twin of generate(); lets concurrent negotiations overlap I/O.
+
+        Uses a shared httpx.AsyncClient when httpx is installed, otherwise
+        falls back to running the blocking call in a worker thread.
+        """
+        if httpx is None:
+            return await asyncio.to_thread(self.generate, prompt, max_tokens, temperature)
+        # An AsyncClient is bound to the loop that created it; repeated
+        # asyncio.run() calls each get a fresh loop, so recreate the client
+        # whenever the running loop changes instead of silently failing.
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            if self._async_client is not None:
+                try:
+                    await self._async_client.aclose()
+                except Exception:
+                    pass  # the old loop may already be closed
+            self._async_client = httpx.AsyncClient(headers=self.headers)
+            self._async_client_loop = loop
+        payload = self._build_payload(prompt, max_tokens, temperature)
+        r = await self._async_client.post(self.endpoint, json=payload, timeout=60)
+        r.raise_for_status()
+        return self._extract_text(r.json())
+
+    async def aclose(self) -> None:
+        """Close the pooled async client; call when done with generate_async."""
+        if self._async_client is not None:
+            try:
+                await self._async_client.aclose()
+            except Exception:
+                pass
+            self._async_client = None
+            self._async_client_loop = None
+
+    def generate_batch(self, prompts: List[str], max_tokens: int = 160, temperature: Optional[float] = 0.7) -> List[str]:
+        """Generate for several prompts in one request (HF accepts list inputs)."""
+        if not prompts:
+            return []
+        payload = self._build_payload(list(prompts), max_tokens, temperature)
+        r = self.session.post(self.endpoint, json=payload, timeout=120)
+        r.raise_for_status()
+        data = r.json()
+        if isinstance(data, list) and len(data) == len(prompts):
+            return [self._extract_text(item) for item in data]
+        # Unexpected shape: stringify once rather than guessing alignment.
+        return [str(data)] * len(prompts)
+
 
 # ==============================
 # Negotiation structures
@@ -72,14 +235,16 @@ class DealStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NegotiationResponse:
     status: DealStatus
     price: Optional[int]
     message: str
 
 
-@dataclass
+# slots + frozen: no per-instance __dict__, which matters when scenario
+# sweeps create these by the thousands
+@dataclass(slots=True, frozen=True)
 class Product:
     name: str
     category: str
@@ -93,31 +258,42 @@ class Product:
 # ==============================
 # Concordia-style components
 # ==============================
+@dataclass(slots=True)
+class Turn:
+    """One logged utterance; slotted record, ~60% lighter than a 4-key dict."""
+    round: int
+    role: str
+    message: str
+    price: Optional[int]
+
+
 class MemoryComponent:
     """Keeps short serialized history (round, role, msg, price)."""
 
     def __init__(self, max_len: int = 200) -> None:
         self.max_len = max_len
-        self.history: List[Dict[str, Any]] = []
+        # deque(maxlen=...) drops the oldest entry in O(1); list.pop(0) shifts
+        # the whole buffer on every overflow.
+        self.history: Deque[Turn] = deque(maxlen=max_len)
 
     def add(self, round_num: int, role: str, message: str, price: Optional[int]) -> None:
-        self.history.append(
-            {"round": int(round_num), "role": role, "message": message, "price": price}
-        )
-        if len(self.history) > self.max_len:
-            self.history.pop(0)
+        self.history.append(Turn(int(round_num), role, message, price))
 
     def summary(self, last_n: int = 8) -> str:
-        recent = self.history[-last_n:]
+        recent = islice(self.history, max(0, len(self.history) - last_n), None)
         return "\n".join(
-            f"R{h['round']} {h['role']}: {h['message']} (₹{h['price']})" for h in recent
+            f"R{t.round} {t.role}: {t.message} (₹{t.price})" for t in recent
         )
 
     def get_state(self) -> Dict[str, Any]:
-        return {"history": self.history}
+        return {"history": list(self.history)}
 
     def set_state(self, state: Dict[str, Any]) -> None:
-        self.history = state.get("history", [])
+        # Accept dict entries too, for state saved before Turn existed
+        self.history = deque(
+            (Turn(**t) if isinstance(t, dict) else t for t in state.get("history", [])),
+            maxlen=self.max_len,
+        )
 
 
 class PersonalityComponent:
@@ -126,16 +302,27 @@ class PersonalityComponent:
     def __init__(self, config_path: str = "personality_config.json") -> None:
         with open(config_path, "r", encoding="utf-8") as fh:
             self.persona: Dict[str, Any] = json.load(fh)
+        self._extract_fields()
 
-    def make_prompt(self) -> str:
+    def _extract_fields(self) -> None:
+        # Persona is immutable between set_state calls: pull the hot fields
+        # into plain attributes once instead of dict-getting per call.
         p = self.persona
-        traits = ", ".join(p.get("traits", []))
-        style = p.get("negotiation_style", p.get("style", "direct"))
-        phrases = ", ".join(p.get("catchphrases", []))
-        return f"Persona: {p.get('name', 'Buyer')} | Style: {style} | Traits: {traits} | Catchphrases: {phrases}"
+        self.name = p.get("name", "Buyer")
+        self.style = p.get("negotiation_style", p.get("style", "direct"))
+        self.traits_str = ", ".join(p.get("traits", []))
+        self.catchphrases_str = ", ".join(p.get("catchphrases", []))
+        self._strategy_params: Dict[str, Any] = p.get("strategy_params", {})
+        self._prompt = (
+            f"Persona: {self.name} | Style: {self.style} | "
+            f"Traits: {self.traits_str} | Catchphrases: {self.catchphrases_str}"
+        )
+
+    def make_prompt(self) -> str:
+        return self._prompt
 
     def strategy_params(self) -> Dict[str, Any]:
-        return self.persona.get("strategy_params", {})
+        return self._strategy_params
 
     def get_state(self) -> Dict[str, Any]:
         return {"persona": self.persona}
@@ -143,6 +330,7 @@ class PersonalityComponent:
     def set_state(self, state: Dict[str, Any]) -> None:
         if state.get("persona"):
             self.persona = state["persona"]
+            self._extract_fields()
 
 
 class ObservationComponent:
@@ -150,19 +338,39 @@ class ObservationComponent:
 
     PRICE_RE = re.compile(r"(?:₹|INR|Rs\.?)\s*([\d,]+)|\b(\d{4,})\b", re.I)
 
+    # All signals fused into one alternation so parse() walks the message
+    # once instead of running a separate search per signal.
+    SIGNALS_RE = re.compile(
+        r"(?P<final>\b(?:final|take it or leave it|last)\b)"
+        r"|(?P<urgent>\b(?:urgent|today|immediately)\b)"
+        r"|(?P<conc>\b(?:come down|reduce|lower)\b)"
+        r"|(?:₹|INR|Rs\.?)\s*(?P<price>[\d,]+)"
+        r"|\b(?P<bignum>\d{4,})\b",
+        re.I,
+    )
+
     def parse(self, seller_message: str) -> Dict[str, Any]:
         seller_price = None
-        m = self.PRICE_RE.search(seller_message)
-        if m:
-            num = m.group(1) or m.group(2)
-            try:
-                seller_price = int(num.replace(",", ""))
-            except Exception:
-                seller_price = None
-
-        is_final = bool(re.search(r"\b(final|take it or leave it|last)\b", seller_message, re.I))
-        urgency = 0.9 if is_final or re.search(r"\b(urgent|today|immediately)\b", seller_message, re.I) else 0.3
-        concession = bool(re.search(r"\b(come down|reduce|lower)\b", seller_message, re.I))
+        is_final = False
+        urgent = False
+        concession = False
+
+        for m in self.SIGNALS_RE.finditer(seller_message):
+            kind = m.lastgroup
+            if kind in ("price", "bignum"):
+                if seller_price is None:
+                    try:
+                        seller_price = int(m.group(kind).replace(",", ""))
+                    except Exception:
+                        seller_price = None
+            elif kind == "final":
+                is_final = True
+            elif kind == "urgent":
+                urgent = True
+            elif kind == "conc":
+                concession = True
+
+        urgency = 0.9 if is_final or urgent else 0.3
 
         return {
             "seller_price": seller_price,
@@ -173,6 +381,81 @@ class ObservationComponent:
         }
 
 
+# Outcome codes returned by _decide_numeric; DecisionComponent.decide maps
+# them back to DealStatus + message text.
+_BR_OPENING = 0       # ONGOING, anchor offer
+_BR_ASK = 1           # ONGOING, no number yet
+_BR_ACCEPT_FAIR = 2   # ACCEPTED at/below fair bound
+_BR_ACCEPT_FINAL = 3  # ACCEPTED a "final" offer within walkaway budget
+_BR_ACCEPT_LATE = 4   # ACCEPTED in the deadline round
+_BR_LAST_CALL = 5     # ONGOING, sharp deadline counter
+_BR_ACCEPT_MATCH = 6  # ACCEPTED because our counter met the ask
+_BR_COUNTER = 7       # ONGOING, normal concession counter
+
+
+@njit(cache=True)
+def _decide_numeric(base_price, base_factor, urgency, budget,
+                    seller_price, is_final, concession, round_num,
+                    opening_price, mid_price, late_price, final_round, walkaway_pct):
+    """Pure numeric core of the aggressive strategy.
+
+    Branch-and-arithmetic only (no objects, no strings) so numba can compile
+    it for large strategy grid searches; runs as plain Python when numba is
+    absent. base_factor carries the precomputed quality/export adjustment and
+    opening/mid/late_price are the per-product concession targets, already
+    strength-reduced to integers; seller_price < 0 means "no number quoted
+    yet". Returns a (branch_code, price) pair with price -1 when there is no
+    offer.
+    """
+    factor = base_factor * (1.0 + 0.10 * urgency)
+    fair = int(base_price * factor)
+    if fair > budget:
+        fair = budget
+
+    # No clear number yet → open or ask
+    if seller_price < 0:
+        if round_num == 1:
+            opening = opening_price
+            if opening > budget:
+                opening = budget
+            return _BR_OPENING, opening
+        return _BR_ASK, -1
+
+    # Accept if seller at/below our fair bound
+    if seller_price <= fair:
+        return _BR_ACCEPT_FAIR, seller_price
+
+    # If seller claims final and it fits within a near-walkaway budget, accept
+    if is_final and seller_price <= budget and seller_price <= int(budget * walkaway_pct):
+        return _BR_ACCEPT_FINAL, seller_price
+
+    # Near deadline: last sharp move
+    if round_num >= final_round:
+        counter = (seller_price + budget) // 2
+        if counter > budget:
+            counter = budget
+        if counter >= seller_price:
+            return _BR_ACCEPT_LATE, seller_price
+        return _BR_LAST_CALL, counter
+
+    # Normal concession path: indexed round bucket, integer math throughout
+    if round_num <= 3:
+        counter = opening_price
+    elif round_num <= 7:
+        counter = mid_price
+    else:
+        counter = late_price
+    if counter > budget:
+        counter = budget
+    if concession:
+        counter = counter * 108 // 100
+        if counter > budget:
+            counter = budget
+    if counter >= seller_price:
+        return _BR_ACCEPT_MATCH, seller_price
+    return _BR_COUNTER, counter
+
+
 class DecisionComponent:
     """Aggressive strategy: low anchor (60–70%), pressure, larger jumps near deadline."""
 
@@ -189,32 +472,41 @@ class DecisionComponent:
         self.walkaway_threshold_pct = float(cfg.get("walkaway_threshold_pct", 0.98))
         self.max_rounds = int(cfg.get("max_rounds", 10))
 
-    def _fair_price(self, product: Product, urgency: float, budget: int) -> int:
-        base = product.base_market_price
+        # Concession percentages as scaled integers, so per-product price
+        # tables below can be built with integer multiply + floor-divide
+        # instead of a float multiply and truncate per round.
+        self._opening_num = int(round(self.opening_pct * 10000))
+        self._mid_num = int(round(self.mid_pct * 10000))
+        self._late_num = int(round(self.late_pct * 10000))
+
+        # Per-product invariants (quality/export factor + concession price
+        # table), computed on first sight instead of re-deriving them every
+        # round. Keyed by the value fields they depend on — never by object
+        # identity, which gets recycled after GC — and bounded by lru_cache.
+        self._invariants = lru_cache(maxsize=128)(self._compute_invariants)
+
+    def _compute_invariants(self, base: int, quality: str, export: bool) -> Tuple[float, int, int, int]:
         factor = 1.0
         # simple quality/origin tweaks
-        q = (product.quality_grade or "").lower()
-        if q.startswith("a"):
+        if quality == "a":
             factor *= 1.05
-        elif q.startswith("b"):
+        elif quality == "b":
             factor *= 0.98
-        if product.attributes.get("export_grade"):
+        if export:
             factor *= 1.05
-        factor *= (1 + 0.10 * urgency)
-        fair = int(base * factor)
-        return min(fair, budget)
-
-    def _opening(self, product: Product, budget: int) -> int:
-        return min(int(product.base_market_price * self.opening_pct), budget)
-
-    def _concession(self, product: Product, budget: int, round_num: int) -> int:
-        if round_num <= 3:
-            pct = self.opening_pct
-        elif round_num <= 7:
-            pct = self.mid_pct
-        else:
-            pct = self.late_pct
-        return min(int(product.base_market_price * pct), budget)
+        return (
+            factor,
+            base * self._opening_num // 10000,
+            base * self._mid_num // 10000,
+            base * self._late_num // 10000,
+        )
+
+    def _product_invariants(self, product: Product) -> Tuple[float, int, int, int]:
+        return self._invariants(
+            product.base_market_price,
+            (product.quality_grade or "").lower()[:1],
+            bool(product.attributes.get("export_grade")),
+        )
 
     def decide(self, product: Product, budget: int, observation: Dict[str, Any], round_num: int) -> Tuple[DealStatus, Optional[int], str]:
         seller_price = observation.get("seller_price")
@@ -222,41 +514,73 @@ class DecisionComponent:
         urgency = float(observation.get("urgency", 0.3))
         concession = bool(observation.get("concession", False))
 
-        fair = self._fair_price(product, urgency, budget)
+        base_factor, opening_price, mid_price, late_price = self._product_invariants(product)
+        branch, price = _decide_numeric(
+            product.base_market_price,
+            base_factor,
+            urgency,
+            budget,
+            -1 if seller_price is None else seller_price,
+            is_final,
+            concession,
+            round_num,
+            opening_price,
+            mid_price,
+            late_price,
+            self.final_round,
+            self.walkaway_threshold_pct,
+        )
+        price = int(price)
 
-        # No clear number yet → open or ask
-        if seller_price is None:
-            if round_num == 1:
-                opening = self._opening(product, budget)
-                return DealStatus.ONGOING, opening, f"My anchor is ₹{opening}. Put a solid number on the table."
+        # Wrap the numeric outcome in status + message text
+        if branch == _BR_OPENING:
+            return DealStatus.ONGOING, price, f"My anchor is ₹{price}. Put a solid number on the table."
+        if branch == _BR_ASK:
             return DealStatus.ONGOING, None, "Quote a numeric price and we can move."
+        if branch == _BR_ACCEPT_FAIR:
+            return DealStatus.ACCEPTED, price, f"Done at ₹{price}. Seal it."
+        if branch == _BR_ACCEPT_FINAL:
+            return DealStatus.ACCEPTED, price, f"Fine—final at ₹{price}. Close now."
+        if branch == _BR_ACCEPT_LATE:
+            return DealStatus.ACCEPTED, price, f"Alright, I’ll take ₹{price}."
+        if branch == _BR_LAST_CALL:
+            return DealStatus.ONGOING, price, f"Last call: ₹{price}. Take it or leave it."
+        if branch == _BR_ACCEPT_MATCH:
+            return DealStatus.ACCEPTED, price, f"Okay, I’ll match ₹{price}."
 
-        # Accept if seller at/below our fair bound
-        if seller_price <= fair:
-            return DealStatus.ACCEPTED, seller_price, f"Done at ₹{seller_price}. Seal it."
+        persona = self.personality.make_prompt()
+        pressure = " If you can’t move, I walk—plenty of options." if (round_num >= 4 and not concession) else ""
+        return DealStatus.ONGOING, price, f"{persona} I can do ₹{price}.{pressure}"
 
-        # If seller claims final and it fits within a near-walkaway budget, accept
-        if is_final and seller_price <= budget and seller_price <= int(budget * self.walkaway_threshold_pct):
-            return DealStatus.ACCEPTED, seller_price, f"Fine—final at ₹{seller_price}. Close now."
 
-        # Near deadline: last sharp move
-        if round_num >= self.final_round:
-            counter = min(int((seller_price + budget) / 2), budget)
-            if counter >= seller_price:
-                return DealStatus.ACCEPTED, seller_price, f"Alright, I’ll take ₹{seller_price}."
-            return DealStatus.ONGOING, counter, f"Last call: ₹{counter}. Take it or leave it."
+class DraftRewriter:
+    """Cheap local draft of the phrasing step (speculative rewrite).
 
-        # Normal concession path
-        counter = self._concession(product, budget, round_num)
-        if concession:
-            counter = min(int(counter * 1.08), budget)
+    Negotiation lines are stock templates, so a rule-based rewrite — drop the
+    verbose persona preamble, rotate in a persona catchphrase — is almost
+    always good enough. BuyerAgent only falls through to the remote model
+    when a draft fails its acceptance check, cutting HF calls to the rare
+    lines the rules can't handle.
+    """
 
-        if counter >= seller_price:
-            return DealStatus.ACCEPTED, seller_price, f"Okay, I’ll match ₹{seller_price}."
+    def __init__(self, personality: PersonalityComponent) -> None:
+        self.personality = personality
+        self._turn = 0
 
+    def rewrite(self, raw_text: str) -> str:
+        text = raw_text.strip()
+        # The counter template prefixes the full persona prompt; strip it.
         persona = self.personality.make_prompt()
-        pressure = " If you can’t move, I walk—plenty of options." if (round_num >= 4 and not concession) else ""
-        return DealStatus.ONGOING, counter, f"{persona} I can do ₹{counter}.{pressure}"
+        if persona and persona in text:
+            text = text.replace(persona, "", 1).strip()
+        # Rotate a catchphrase in for persona color, unless already present.
+        phrases = self.personality.persona.get("catchphrases", [])
+        if phrases:
+            phrase = phrases[self._turn % len(phrases)]
+            self._turn += 1
+            if phrase.rstrip(".!?").lower() not in text.lower():
+                text = f"{phrase} {text}"
+        return text
 
 
 # ==============================
@@ -267,29 +591,161 @@ class BuyerAgent:
     Public API is stable for your run_match.py.
     """
 
+    # Decision templates differ only in the rupee amount, so cache rewrites
+    # keyed on the price-normalized text and substitute fresh numbers back in.
+    _PRICE_TOKEN_RE = re.compile(r"₹\d+")
+    _PRICE_PLACEHOLDER = "₹<P>"
+    _PHRASE_CACHE_MAX = 512
+
     def __init__(self, personality_path: str, model: Optional[HuggingFaceModelWrapper] = None) -> None:
         self.memory = MemoryComponent()
         self.personality = PersonalityComponent(personality_path)
         self.observer = ObservationComponent()
         self.decision = DecisionComponent(self.personality, self.memory)
         self.model = model  # optional phrasing
+        self.draft = DraftRewriter(self.personality)
+        self._phrase_cache: Dict[str, str] = {}
+        # When set, freshly generated rewrites stream through this callback
+        # token by token (used by the interactive CLI). Cached/draft lines
+        # produce no tokens.
+        self.stream_callback: Optional[Callable[[str], None]] = None
+        # Bind the phrasing path once instead of re-checking `self.model` on
+        # every negotiate() call.
+        self._phrase = self._phrase_with_model if model is not None else (lambda text: text)
+
+    def _fill_prices(self, template: str, prices: List[str]) -> str:
+        for p in prices:
+            template = template.replace(self._PRICE_PLACEHOLDER, p, 1)
+        return template
+
+    @staticmethod
+    def _rewrite_prompt(raw_text: str) -> str:
+        # Light prompt to keep style but preserve intent
+        return (
+            f"Rewrite as a concise, confident buyer line, same meaning, keep numbers intact:\n"
+            f"---\n{raw_text}\n---"
+        )
+
+    def _cache_template(self, cache_key: str, raw_text: str, phrased: str) -> None:
+        # Only cache rewrites that kept every price intact, so later hits can
+        # safely substitute new numbers into the remembered template.
+        if self._PRICE_TOKEN_RE.findall(phrased) == self._PRICE_TOKEN_RE.findall(raw_text):
+            if len(self._phrase_cache) >= self._PHRASE_CACHE_MAX:
+                self._phrase_cache.clear()
+            self._phrase_cache[cache_key] = self._PRICE_TOKEN_RE.sub(
+                self._PRICE_PLACEHOLDER, phrased
+            )
 
-    def _phrase(self, raw_text: str) -> str:
-        if not self.model:
+    def _acceptable(self, draft: str, raw_text: str) -> bool:
+        """A draft passes if it kept every price intact and stayed a short line."""
+        return (
+            bool(draft)
+            and len(draft) <= 200
+            and self._PRICE_TOKEN_RE.findall(draft) == self._PRICE_TOKEN_RE.findall(raw_text)
+        )
+
+    def _try_draft(self, cache_key: str, raw_text: str) -> Optional[str]:
+        """Speculative local rewrite; returns None when the remote model is needed."""
+        draft = self.draft.rewrite(raw_text)
+        if self._acceptable(draft, raw_text):
+            self._cache_template(cache_key, raw_text, draft)
+            return draft
+        return None
+
+    def phrase_batch(self, raw_texts: List[str]) -> List[str]:
+        """Rewrite many lines with a single HF request.
+
+        Deduplicates on the price-normalized template, sends only the cache
+        misses in one generate_batch call, then answers every line from the
+        template cache. Lines whose rewrite mangled a price fall back to the
+        raw text, same as `_phrase`.
+        """
+        if not self.model or not raw_texts:
+            return list(raw_texts)
+
+        pending: Dict[str, str] = {}  # cache_key -> representative raw text
+        for text in raw_texts:
+            key = self._PRICE_TOKEN_RE.sub(self._PRICE_PLACEHOLDER, text)
+            if key not in self._phrase_cache and key not in pending:
+                # Draft locally first; only ship draft rejects to the model.
+                if self._try_draft(key, text) is None:
+                    pending[key] = text
+
+        if pending:
+            prompts = [self._rewrite_prompt(t) for t in pending.values()]
+            try:
+                outs = self.model.generate_batch(prompts, max_tokens=80, temperature=None)
+            except Exception:
+                outs = []
+            for (key, text), out in zip(pending.items(), outs):
+                phrased = (out or text).strip()[:500]
+                self._cache_template(key, text, phrased)
+
+        results: List[str] = []
+        for text in raw_texts:
+            key = self._PRICE_TOKEN_RE.sub(self._PRICE_PLACEHOLDER, text)
+            template = self._phrase_cache.get(key)
+            if template is not None:
+                results.append(self._fill_prices(template, self._PRICE_TOKEN_RE.findall(text)))
+            else:
+                results.append(text)
+        return results
+
+    def _phrase_with_model(self, raw_text: str) -> str:
+        prices = self._PRICE_TOKEN_RE.findall(raw_text)
+        cache_key = self._PRICE_TOKEN_RE.sub(self._PRICE_PLACEHOLDER, raw_text)
+        template = self._phrase_cache.get(cache_key)
+        if template is not None:
+            return self._fill_prices(template, prices)
+
+        draft = self._try_draft(cache_key, raw_text)
+        if draft is not None:
+            return draft
+
+        try:
+            # Deterministic output so identical prompts hit the HF cache.
+            prompt = self._rewrite_prompt(raw_text)
+            if self.stream_callback is not None and hasattr(self.model, "generate_stream"):
+                parts: List[str] = []
+                for tok in self.model.generate_stream(prompt, max_tokens=80, temperature=None):
+                    parts.append(tok)
+                    self.stream_callback(tok)
+                out = "".join(parts)
+            else:
+                out = self.model.generate(prompt, max_tokens=80, temperature=None)
+            phrased = (out or raw_text).strip()[:500]
+        except Exception:
             return raw_text
+
+        self._cache_template(cache_key, raw_text, phrased)
+        return phrased
+
+    async def _phrase_async(self, raw_text: str) -> str:
+        """Async twin of the model phrasing path; shares the template cache."""
+        if self.model is None:
+            return raw_text
+
+        prices = self._PRICE_TOKEN_RE.findall(raw_text)
+        cache_key = self._PRICE_TOKEN_RE.sub(self._PRICE_PLACEHOLDER, raw_text)
+        template = self._phrase_cache.get(cache_key)
+        if template is not None:
+            return self._fill_prices(template, prices)
+
+        draft = self._try_draft(cache_key, raw_text)
+        if draft is not None:
+            return draft
+
         try:
-            # Light prompt to keep style but preserve intent
-            prompt = (
-                f"Rewrite as a concise, confident buyer line, same meaning, keep numbers intact:\n"
-                f"---\n{raw_text}\n---"
-            )
-            out = self.model.generate(prompt, max_tokens=80, temperature=0.4)
-            return (out or raw_text).strip()[:500]
+            out = await self.model.generate_async(self._rewrite_prompt(raw_text), max_tokens=80, temperature=None)
+            phrased = (out or raw_text).strip()[:500]
         except Exception:
             return raw_text
 
-    def negotiate(self, product: Product, budget: int, seller_message: str, round_num: int) -> NegotiationResponse:
-        """Main method used by run_match.py."""
+        self._cache_template(cache_key, raw_text, phrased)
+        return phrased
+
+    def _decide_round(self, product: Product, budget: int, seller_message: str, round_num: int):
+        """Shared decision step for negotiate/negotiate_async."""
         obs = self.observer.parse(seller_message)
         status, price, message = self.decision.decide(product, budget, obs, round_num)
 
@@ -297,12 +753,30 @@ class BuyerAgent:
         if price is not None and price > budget:
             price = budget
 
-        phrased = self._phrase(message)
+        # Terminal closings and the round-1 anchor are short stock lines;
+        # skip the LLM rewrite for them.
+        skip_phrasing = status in (DealStatus.ACCEPTED, DealStatus.REJECTED) or (
+            round_num == 1 and obs.get("seller_price") is None
+        )
+        return obs, status, price, message, skip_phrasing
 
-        # memory logging
+    def _log_round(self, obs: Dict[str, Any], seller_message: str, phrased: str, price: Optional[int], round_num: int) -> None:
         self.memory.add(round_num, "Seller", seller_message, obs.get("seller_price"))
         self.memory.add(round_num, "Buyer", phrased, price)
 
+    def negotiate(self, product: Product, budget: int, seller_message: str, round_num: int) -> NegotiationResponse:
+        """Main method used by run_match.py."""
+        obs, status, price, message, skip_phrasing = self._decide_round(product, budget, seller_message, round_num)
+        phrased = message if skip_phrasing else self._phrase(message)
+        self._log_round(obs, seller_message, phrased, price, round_num)
+        return NegotiationResponse(status=status, price=price, message=phrased)
+
+    async def negotiate_async(self, product: Product, budget: int, seller_message: str, round_num: int) -> NegotiationResponse:
+        """Like negotiate(), but awaits the HF rewrite so independent
+        negotiations can overlap their network round-trips."""
+        obs, status, price, message, skip_phrasing = self._decide_round(product, budget, seller_message, round_num)
+        phrased = message if skip_phrasing else await self._phrase_async(message)
+        self._log_round(obs, seller_message, phrased, price, round_num)
         return NegotiationResponse(status=status, price=price, message=phrased)
 
     # Helper used by interactive CLI (keeps run_match.py untouched)
@@ -11,10 +11,16 @@ Run:
 
 import os
 from buyer_agent import BuyerAgent, Product, HuggingFaceModelWrapper
-from dotenv import load_dotenv
+from local_model import LocalGGUFWrapper
 
 def maybe_load_hf_model():
-    load_dotenv()
+    # .env is loaded once when buyer_agent is imported
+    if os.getenv("LOCAL_GGUF_PATH"):
+        try:
+            print("✅ Using local GGUF model for phrasing.")
+            return LocalGGUFWrapper()
+        except Exception as e:
+            print("⚠️  Could not init local GGUF model. Reason:", e)
     api = os.getenv("HF_API_KEY")
     if not api:
         print("⚠️  HF_API_KEY not set. Running WITHOUT Hugging Face phrasing (logic still works).")
@@ -76,8 +82,22 @@ def main():
 
     for round_num in range(1, 11):
         # Buyer responds to the seller message (string) so the logic sees context, not only price
+        # Stream freshly generated rewrites token by token; cached/stock lines
+        # arrive whole and are printed normally.
+        print(f"Buyer (R{round_num}): ", end="", flush=True)
+        streamed = []
+
+        def _on_token(tok: str) -> None:
+            streamed.append(tok)
+            print(tok, end="", flush=True)
+
+        agent.stream_callback = _on_token
         response = agent.negotiate(product, budget, seller_msg, round_num)
-        print(f"Buyer (R{round_num}): {response.message}")
+        agent.stream_callback = None
+        if streamed:
+            print()
+        else:
+            print(response.message)
         if response.status.name == "ACCEPTED":
             print(f"✅ Deal closed at ₹{response.price:,} on round {round_num}")
             return
@@ -0,0 +1,63 @@
+# local_model.py
+"""
+Local quantized-model wrapper (llama.cpp GGUF).
+
+Drop-in alternative to HuggingFaceModelWrapper for phrasing: exposes the same
+generate()/generate_async() interface but runs a quantized model on the local
+CPU, so a short rewrite costs tens of milliseconds with no network round-trip
+and no API key. The rewrite task is simple enough that a small instruct model
+(TinyLlama, Phi-3-mini) in Q4 holds up fine.
+
+Usage:
+  export LOCAL_GGUF_PATH=/path/to/Phi-3-mini-4k-instruct-q4.gguf
+  python run_match.py
+"""
+import asyncio
+import os
+from typing import Optional
+
+
+class LocalGGUFWrapper:
+    """Minimal wrapper around llama-cpp-python (text generation).
+    If llama_cpp or the model file is unavailable, raise at init so the
+    caller can fall back gracefully, same as the HF wrapper.
+    """
+
+    def __init__(self, model_path: Optional[str] = None, n_ctx: int = 1024) -> None:
+        try:
+            from llama_cpp import Llama
+        except ImportError as exc:
+            raise RuntimeError(
+                "llama-cpp-python not installed. "
+                "Install it with: pip install llama-cpp-python"
+            ) from exc
+
+        model_path = model_path or os.getenv("LOCAL_GGUF_PATH")
+        if not model_path or not os.path.exists(model_path):
+            raise RuntimeError(
+                "GGUF model file not found. Set LOCAL_GGUF_PATH to a quantized "
+                ".gguf file (e.g. a Q4_K_M build of a small instruct model)."
+            )
+
+        self.model_path = model_path
+        self.llm = Llama(
+            model_path=model_path,
+            n_ctx=n_ctx,
+            n_threads=os.cpu_count(),
+            verbose=False,
+        )
+
+    def generate(self, prompt: str, max_tokens: int = 160, temperature: Optional[float] = 0.7) -> str:
+        """Basic text generation call, same signature as the HF wrapper."""
+        if temperature is None:
+            temperature = 0.0  # llama.cpp treats 0 as greedy decoding
+        out = self.llm(prompt, max_tokens=max_tokens, temperature=temperature)
+        choices = out.get("choices") or []
+        if choices and "text" in choices[0]:
+            return str(choices[0]["text"]).strip()
+        return str(out)
+
+    async def generate_async(self, prompt: str, max_tokens: int = 160, temperature: Optional[float] = 0.7) -> str:
+        """llama.cpp is blocking; run it in a worker thread so concurrent
+        negotiations stay responsive."""
+        return await asyncio.to_thread(self.generate, prompt, max_tokens, temperature)
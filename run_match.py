@@ -4,8 +4,15 @@ Use this to evaluate performance locally.
 """
 from dataclasses import dataclass
 from typing import Tuple, Optional
-import json, os
+import asyncio
+import json, os, sys
 from buyer_agent import BuyerAgent, Product, NegotiationResponse, DealStatus, HuggingFaceModelWrapper
+from local_model import LocalGGUFWrapper
+
+try:
+    import numpy as np  # optional: only needed for vectorized grid sweeps
+except ImportError:
+    np = None
 
 @dataclass
 class MockSeller:
@@ -29,6 +36,9 @@ class MockSeller:
         return counter, f"I can come down to ₹{counter}.", False
 
 def run_single_simulation(agent: BuyerAgent, product: Product, buyer_budget: int, seller_min: int) -> dict:
+    return asyncio.run(run_single_simulation_async(agent, product, buyer_budget, seller_min))
+
+async def run_single_simulation_async(agent: BuyerAgent, product: Product, buyer_budget: int, seller_min: int) -> dict:
     seller = MockSeller(min_price=seller_min)
     # Seller opens
     seller_price, seller_msg = seller.get_opening_price(product)
@@ -40,7 +50,7 @@ def run_single_simulation(agent: BuyerAgent, product: Product, buyer_budget: int
 
     for round_num in range(1, 11):  # 1..10
         # Buyer responds
-        response = agent.negotiate(product, buyer_budget, seller_msg, round_num)
+        response = await agent.negotiate_async(product, buyer_budget, seller_msg, round_num)
         conversation.append({"role":"buyer","message":response.message, "price": response.price})
         if response.status == DealStatus.ACCEPTED:
             deal_made = True
@@ -64,25 +74,147 @@ def run_single_simulation(agent: BuyerAgent, product: Product, buyer_budget: int
     }
     return result
 
-def main():
-    # Load product examples
-    products = [
+def simulate_batch(product: Product, budgets, seller_mins, strategy_params: Optional[dict] = None) -> dict:
+    """Vectorized replica of run_single_simulation for large scenario grids.
+
+    Runs N no-LLM negotiations (one per budgets[i]/seller_mins[i] pair) in
+    lockstep with NumPy masks instead of a Python loop per scenario. The
+    numeric decisions match BuyerAgent/MockSeller exactly; only the message
+    text is skipped. Returns arrays: deal_made, final_price, rounds, savings.
+    """
+    if np is None:
+        raise RuntimeError("❌ NumPy is required for simulate_batch. Install it with: pip install numpy")
+
+    cfg = strategy_params or {}
+    opening_pct = float(cfg.get("opening_pct", 0.65))
+    mid_pct = float(cfg.get("mid_pct", 0.80))
+    late_pct = float(cfg.get("late_pct", 0.95))
+    final_round = int(cfg.get("final_round", 9))
+    walkaway_pct = float(cfg.get("walkaway_threshold_pct", 0.98))
+    max_rounds = int(cfg.get("max_rounds", 10))
+
+    budgets = np.asarray(budgets, dtype=np.int64)
+    seller_mins = np.asarray(seller_mins, dtype=np.int64)
+    base = np.int64(product.base_market_price)
+
+    # Product-level quality/export factor, same as DecisionComponent._fair_price
+    qfac = 1.0
+    q = (product.quality_grade or "").lower()
+    if q.startswith("a"):
+        qfac *= 1.05
+    elif q.startswith("b"):
+        qfac *= 0.98
+    if product.attributes.get("export_grade"):
+        qfac *= 1.05
+
+    # Same integer price table DecisionComponent precomputes per product
+    opening_price = int(base) * int(round(opening_pct * 10000)) // 10000
+    mid_price = int(base) * int(round(mid_pct * 10000)) // 10000
+    late_price = int(base) * int(round(late_pct * 10000)) // 10000
+
+    n = budgets.shape[0]
+    active = np.ones(n, dtype=bool)
+    deal_made = np.zeros(n, dtype=bool)
+    final_price = np.zeros(n, dtype=np.int64)
+    rounds = np.full(n, max_rounds, dtype=np.int64)
+
+    # Seller opens at 1.5x market with no finality/concession cues
+    seller_price = np.full(n, int(base * 1.5), dtype=np.int64)
+    is_final = np.zeros(n, dtype=bool)
+    concession = np.zeros(n, dtype=bool)
+
+    def _trunc(x):
+        return np.floor(x).astype(np.int64)
+
+    for round_num in range(1, max_rounds + 1):
+        # --- buyer decides (DecisionComponent.decide, numeric path) ---
+        urgency = np.where(is_final, 0.9, 0.3)
+        fair = np.minimum(_trunc(base * qfac * (1.0 + 0.10 * urgency)), budgets)
+
+        accept_fair = seller_price <= fair
+        accept_final = is_final & (seller_price <= budgets) & (seller_price <= _trunc(budgets * walkaway_pct))
+
+        if round_num >= final_round:
+            counter = np.minimum((seller_price + budgets) // 2, budgets)
+        else:
+            price = opening_price if round_num <= 3 else mid_price if round_num <= 7 else late_price
+            counter = np.minimum(np.int64(price), budgets)
+            counter = np.where(concession, np.minimum(counter * 108 // 100, budgets), counter)
+        accept_match = counter >= seller_price
+
+        buyer_accepts = accept_fair | accept_final | accept_match
+        closed = active & buyer_accepts
+        deal_made |= closed
+        final_price = np.where(closed, seller_price, final_price)
+        rounds = np.where(closed, round_num, rounds)
+        active &= ~buyer_accepts
+        if not active.any():
+            break
+
+        # --- seller responds (MockSeller.respond_to_buyer) ---
+        seller_accepts = counter >= _trunc(seller_mins * 1.1)
+        closed = active & seller_accepts
+        deal_made |= closed
+        final_price = np.where(closed, counter, final_price)
+        rounds = np.where(closed, round_num, rounds)
+        active &= ~seller_accepts
+        if not active.any():
+            break
+
+        if round_num >= 8:
+            new_price = np.maximum(seller_mins, _trunc(counter * 1.05))
+            is_final = np.ones(n, dtype=bool)
+            concession = np.zeros(n, dtype=bool)
+        else:
+            new_price = np.maximum(seller_mins, _trunc(counter * 1.15))
+            is_final = np.zeros(n, dtype=bool)
+            concession = np.ones(n, dtype=bool)
+        seller_price = np.where(active, new_price, seller_price)
+
+    savings = np.where(deal_made, budgets - final_price, 0)
+    return {"deal_made": deal_made, "final_price": final_price, "rounds": rounds, "savings": savings}
+
+def run_grid_sweep(n: int = 10000) -> None:
+    """Demo: sweep n random budget/seller-min scenarios per product, vectorized."""
+    products = make_products()
+    rng = np.random.default_rng(42)
+    for product in products:
+        budgets = (product.base_market_price * rng.uniform(0.85, 1.25, n)).astype(np.int64)
+        seller_mins = (product.base_market_price * rng.uniform(0.75, 0.90, n)).astype(np.int64)
+        out = simulate_batch(product, budgets, seller_mins)
+        made = out["deal_made"]
+        print(f"\nGrid: {product.name} | {n:,} scenarios")
+        print(f"  Deals: {made.sum():,} ({100.0 * made.mean():.1f}%)")
+        print(f"  Avg rounds: {out['rounds'][made].mean():.2f} | Avg savings: ₹{out['savings'][made].mean():,.0f}")
+
+def make_products():
+    return [
         Product(name="Alphonso Mangoes", category="Mangoes", quantity=100, quality_grade="A", origin="Ratnagiri", base_market_price=180000, attributes={"export_grade": True}),
         Product(name="Kesar Mangoes", category="Mangoes", quantity=150, quality_grade="B", origin="Gujarat", base_market_price=150000, attributes={"export_grade": False})
     ]
 
-    # Initialize agent with Hugging Face wrapper if HF_API_KEY provided; else model=None
-    hf_key = os.getenv("HF_API_KEY")
+def main():
+    # Load product examples
+    products = make_products()
+
+    # Prefer a local quantized model if LOCAL_GGUF_PATH is set (no network,
+    # ~10x lower phrasing latency); else Hugging Face if HF_API_KEY provided;
+    # else model=None
     model = None
-    if hf_key:
+    if os.getenv("LOCAL_GGUF_PATH"):
+        try:
+            model = LocalGGUFWrapper()
+        except Exception as e:
+            print("Warning: local GGUF wrapper init failed:", e)
+    if model is None and os.getenv("HF_API_KEY"):
         try:
             model = HuggingFaceModelWrapper()
         except Exception as e:
             print("Warning: Hugging Face wrapper init failed:", e)
             model = None
 
-    agent = BuyerAgent(personality_path="personality_config.json", model=model)
-
+    # Scenario grid: (product, scenario, budget, seller_min)
+    specs = []
     scenarios = ["easy","medium","hard"]
     for product in products:
         for scenario in scenarios:
@@ -95,12 +227,41 @@ def main():
             else:
                 buyer_budget = int(product.base_market_price * 0.9)
                 seller_min = int(product.base_market_price * 0.82)
+            specs.append((product, scenario, buyer_budget, seller_min))
 
-            print(f"\nTest: {product.name} - {scenario} scenario\nBudget: ₹{buyer_budget:,} | Market: ₹{product.base_market_price:,}")
-            result = run_single_simulation(agent, product, buyer_budget, seller_min)
-            if result["deal_made"]:
-                print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds | Savings: ₹{result['savings']:,}")
-            else:
-                print(f"❌ NO DEAL after {result['rounds']} rounds")        
+    if model:
+        # The scenarios are independent, so run them concurrently: each round's
+        # HF phrasing overlaps across negotiations and the sweep takes roughly
+        # as long as the slowest single scenario. One agent per scenario keeps
+        # the memories separate; the wrapper (and its pool) is shared.
+        async def _run_all():
+            agents = [BuyerAgent(personality_path="personality_config.json", model=model) for _ in specs]
+            try:
+                return await asyncio.gather(*[
+                    run_single_simulation_async(agent, product, buyer_budget, seller_min)
+                    for agent, (product, _, buyer_budget, seller_min) in zip(agents, specs)
+                ])
+            finally:
+                if hasattr(model, "aclose"):
+                    await model.aclose()
+        results = asyncio.run(_run_all())
+    else:
+        agent = BuyerAgent(personality_path="personality_config.json", model=None)
+        results = [
+            run_single_simulation(agent, product, buyer_budget, seller_min)
+            for product, _, buyer_budget, seller_min in specs
+        ]
+
+    for (product, scenario, buyer_budget, _), result in zip(specs, results):
+        print(f"\nTest: {product.name} - {scenario} scenario\nBudget: ₹{buyer_budget:,} | Market: ₹{product.base_market_price:,}")
+        if result["deal_made"]:
+            print(f"✅ DEAL at ₹{result['final_price']:,} in {result['rounds']} rounds | Savings: ₹{result['savings']:,}")
+        else:
+            print(f"❌ NO DEAL after {result['rounds']} rounds")
 if __name__ == '__main__':
-    main()
+    if "--grid" in sys.argv:
+        idx = sys.argv.index("--grid")
+        n = int(sys.argv[idx + 1]) if idx + 1 < len(sys.argv) else 10000
+        run_grid_sweep(n)
+    else:
+        main()